@@ -9,21 +9,27 @@ Features:
 - Single-player guess-the-number with difficulty levels.
 - Timed mode (optional) and limited attempts mode.
 - Hints (higher/lower, "close" ranges, digit matches).
-- Score calculation and persistent highscores stored in highscores.json.
+- Score calculation and persistent highscores stored in highscores.jsonl.
 - Clean input validation and friendly UI (ASCII headers).
 """
 
 from datetime import datetime
 from pathlib import Path
-import json
+import heapq
+import os
 import random
 import time
 
+import orjson
+
 # ----------------------------
 # Config / constants
 # ----------------------------
 GAME_DIR = Path(__file__).resolve().parent
-HIGHSCORE_FILE = GAME_DIR / "highscores.json"
+HIGHSCORE_FILE = GAME_DIR / "highscores.jsonl"  # one JSON entry per line, append-only
+MAX_HIGHSCORES = 50
+HIGHSCORE_COMPACT_AFTER = 500  # rewrite the log with only the top entries past this many lines
+LEGACY_HIGHSCORE_FILE = GAME_DIR / "highscores.json"  # single JSON list used by older versions
 
 DIFFICULTIES = {
     "easy":    {"min": 1, "max": 50,  "attempts": 10, "time_limit": None},
@@ -35,30 +41,106 @@ DIFFICULTIES = {
 # ----------------------------
 # Utilities: highscores
 # ----------------------------
+# in-memory copy of the highscore log, reused until its mtime or size changes
+_cache = {"stamp": None, "entries": None, "lines": 0}
+
+def _file_stamp(f):
+    # mtime alone can miss a write on filesystems with coarse timestamps;
+    # the append-only log also grows on every write
+    st = os.fstat(f.fileno())
+    return (st.st_mtime_ns, st.st_size)
+
+def _top_scores(entries):
+    # keep highest scores on top (higher is better)
+    return heapq.nlargest(MAX_HIGHSCORES, entries, key=lambda e: e["score"])
+
+def _is_entry(e):
+    # skip anything that is valid JSON but not a highscore row
+    return (isinstance(e, dict) and "name" in e and "difficulty" in e
+            and isinstance(e.get("score"), (int, float)))
+
 def load_highscores():
-    if not HIGHSCORE_FILE.exists():
-        return []
+    # a missing file just means no highscores yet; no separate exists() check
     try:
-        with open(HIGHSCORE_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
+        with open(HIGHSCORE_FILE, "rb") as f:
+            stamp = _file_stamp(f)
+            if _cache["stamp"] != stamp:
+                lines = f.read().splitlines()
+                entries = []
+                for line in lines:
+                    try:
+                        e = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue  # blank or partially written line
+                    if _is_entry(e):
+                        entries.append(e)
+                _cache["entries"] = _top_scores(entries)
+                # count every line, bad ones included, so compaction still triggers
+                _cache["lines"] = len(lines)
+                _cache["stamp"] = stamp
+    except FileNotFoundError:
+        if not _migrate_legacy_highscores():
+            _reset_cache()
+            return []
+    except OSError:
+        _reset_cache()
         return []
+    return list(_cache["entries"])
+
+def _reset_cache():
+    _cache["stamp"] = _cache["entries"] = None
+    _cache["lines"] = 0
+
+def _migrate_legacy_highscores():
+    # carry scores over from highscores.json once, then keep it as a .bak
+    try:
+        with open(LEGACY_HIGHSCORE_FILE, "rb") as f:
+            entries = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return False
+    if not isinstance(entries, list):
+        return False
+    try:
+        save_highscores([e for e in entries if _is_entry(e)])
+        LEGACY_HIGHSCORE_FILE.replace(LEGACY_HIGHSCORE_FILE.with_suffix(".json.bak"))
+    except OSError:
+        return False
+    return True
+
+def append_highscore(entry):
+    entries = load_highscores()
+    # orjson always emits UTF-8, so non-ASCII names are kept as-is
+    with open(HIGHSCORE_FILE, "a+b") as f:
+        record = orjson.dumps(entry) + b"\n"
+        # finish a torn last line first so it doesn't swallow this record
+        if os.fstat(f.fileno()).st_size:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                record = b"\n" + record
+        f.write(record)
+        f.flush()
+        _cache["entries"] = _top_scores(entries + [entry])
+        _cache["lines"] += 1
+        _cache["stamp"] = _file_stamp(f)
 
 def save_highscores(entries):
-    with open(HIGHSCORE_FILE, "w", encoding="utf-8") as f:
-        json.dump(entries, f, indent=2, ensure_ascii=False)
+    # rewrites the whole log; only used to compact it
+    with open(HIGHSCORE_FILE, "wb") as f:
+        f.write(b"".join(orjson.dumps(e) + b"\n" for e in entries))
+        f.flush()
+        _cache["entries"] = _top_scores(entries)
+        _cache["lines"] = len(entries)
+        _cache["stamp"] = _file_stamp(f)
 
 def add_highscore(name, score, difficulty):
-    entries = load_highscores()
-    entries.append({
+    append_highscore({
         "name": name,
         "score": score,
         "difficulty": difficulty,
         "date": datetime.utcnow().isoformat() + "Z"
     })
-    # keep highest scores on top (higher is better)
-    entries = sorted(entries, key=lambda e: e["score"], reverse=True)[:50]
-    save_highscores(entries)
+    if _cache["lines"] > HIGHSCORE_COMPACT_AFTER:
+        save_highscores(load_highscores())
 
 def display_highscores(limit=10):
     entries = load_highscores()
@@ -79,16 +161,22 @@ def header():
     print("🎯 Number Duel — guess the secret number!".center(60))
     print("="*60)
 
-def choose_difficulty():
-    print("Choose difficulty / mode:")
-    for k in DIFFICULTIES:
-        d = DIFFICULTIES[k]
+def _build_difficulty_menu():
+    lines = ["Choose difficulty / mode:"]
+    for k, d in DIFFICULTIES.items():
         desc = f"{k.title()}: {d['min']}–{d['max']}"
         if d["attempts"]:
             desc += f", attempts: {d['attempts']}"
         if d["time_limit"]:
             desc += f", time limit: {d['time_limit']}s"
-        print(f"  - {k}  -> {desc}")
+        lines.append(f"  - {k}  -> {desc}")
+    return "\n".join(lines)
+
+# DIFFICULTIES never changes at runtime, so the menu text is built once
+_DIFFICULTY_MENU = _build_difficulty_menu()
+
+def choose_difficulty():
+    print(_DIFFICULTY_MENU)
     while True:
         pick = input("Enter difficulty (easy/medium/hard/timed): ").strip().lower()
         if pick in DIFFICULTIES:
@@ -101,16 +189,18 @@ def get_int(prompt, min_val=None, max_val=None):
         if not s:
             print("Please enter a number.")
             continue
-        if s.isdigit() or (s.startswith("-") and s[1:].isdigit()):
+        try:
             n = int(s)
-            if min_val is not None and n < min_val:
-                print(f"Number must be at least {min_val}.")
-                continue
-            if max_val is not None and n > max_val:
-                print(f"Number must be at most {max_val}.")
-                continue
-            return n
-        print("That's not a valid integer. Try again.")
+        except ValueError:
+            print("That's not a valid integer. Try again.")
+            continue
+        if min_val is not None and n < min_val:
+            print(f"Number must be at least {min_val}.")
+            continue
+        if max_val is not None and n > max_val:
+            print(f"Number must be at most {max_val}.")
+            continue
+        return n
 
 def give_hint(secret, guess, attempt, max_attempts):
     # Basic higher/lower hint
@@ -130,9 +220,14 @@ def give_hint(secret, guess, attempt, max_attempts):
     digit_hint = ""
     # Digit-match hint when numbers are small-ish
     if secret < 10000 and guess < 10000:
-        secret_s = str(secret)
-        guess_s = str(guess)
-        matches = sum(1 for a,b in zip(secret_s[::-1], guess_s[::-1]) if a==b)
+        # compare digits right-to-left until the shorter number runs out
+        matches = 0
+        s, g = secret, guess
+        while s and g:
+            if s % 10 == g % 10:
+                matches += 1
+            s //= 10
+            g //= 10
         if matches:
             digit_hint = f" (Digits from right matched: {matches})"
     return f"{basic} Try {hl}.{digit_hint}"
@@ -233,7 +328,7 @@ def main():
             print("- Select a difficulty. The game picks a secret integer in that range.")
             print("- Attempt to guess it. The game gives hints and tracks attempts/time.")
             print("- Score is awarded for correct answers; higher score for harder modes and fewer attempts.")
-            print("- Highscores are saved locally in highscores.json.")
+            print("- Highscores are saved locally in highscores.jsonl.")
         elif choice == "4":
             print("Thanks for playing — goodbye!")
             break